@@ -1,26 +1,90 @@
 import discord
 from discord.ext import commands, tasks
 import asyncio
+import io
 import os
+import tempfile
+import weakref
 from datetime import datetime, timedelta, timezone
 import pytz
+import ciso8601
 import logging
-from notion_client import Client
-import requests
-from typing import List, Dict, Optional
+from logging.handlers import QueueHandler, QueueListener
+import queue
+import atexit
+from notion_client import AsyncClient, APIErrorCode, APIResponseError
+import aiohttp
+import orjson
+from cachetools import TTLCache
+from typing import List, Dict, Optional, Tuple
+from urllib.parse import unquote
 import json
+import heapq
+import itertools
+from collections import defaultdict
+from dataclasses import dataclass
+
+try:
+    import uvloop
+except ImportError:  # uvloop is not available on Windows
+    uvloop = None
+
+# Set up logging - file writes happen on a background thread so they
+# never block the event loop. QueueHandler hands the listener records
+# that are already formatted.
+log_file_handler = logging.FileHandler('bot.log')
+log_queue = queue.Queue(-1)
+log_listener = QueueListener(log_queue, log_file_handler)
+log_listener.start()
+atexit.register(log_listener.stop)
 
-# Set up logging
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s',
     handlers=[
-        logging.FileHandler('bot.log'),
+        QueueHandler(log_queue),
         logging.StreamHandler()
     ]
 )
 logger = logging.getLogger(__name__)
 
+# Media downloads are kept in memory up to this size, then spooled to disk
+MEDIA_SPOOL_SIZE = 1024 * 1024
+MEDIA_CHUNK_SIZE = 64 * 1024
+
+# Notion properties read by parse_notion_page
+POST_PROPERTIES = ['Post ID', 'Channel', 'Scheduled Time', 'Content', 'Media URLs', 'Post Type']
+
+# Notion allows an average of ~3 requests per second per integration
+NOTION_WRITES_PER_SECOND = 3
+NOTION_RATE_LIMIT_RETRIES = 3
+
+@dataclass(slots=True)
+class ScheduledPost:
+    """A pending post parsed from the Notion database"""
+    id: str
+    page_id: str
+    channel: str
+    scheduled_time: datetime
+    content: str
+    media_urls: List[str]
+    post_type: str
+    channel_id: Optional[int] = None
+
+class NotionClient(AsyncClient):
+    """AsyncClient that decodes successful responses with orjson"""
+    
+    def _parse_response(self, response):
+        # Errors still go through notion-client's own handling
+        if response.is_error:
+            return super()._parse_response(response)
+        return orjson.loads(response.content)
+
+def first_text(prop: Dict, key: str = 'rich_text') -> Optional[str]:
+    """Return the first text fragment of a Notion title/rich_text property"""
+    items = prop[key]
+    return items[0]['text']['content'] if items else None
+
 class DiscordSchedulerBot(commands.Bot):
     def __init__(self):
         intents = discord.Intents.default()
@@ -28,48 +92,92 @@ class DiscordSchedulerBot(commands.Bot):
         super().__init__(command_prefix='!', intents=intents)
         
         # Initialize Notion client
-        self.notion = Client(auth=os.getenv('NOTION_TOKEN'))
+        self.notion = NotionClient(auth=os.getenv('NOTION_TOKEN'))
         self.database_id = os.getenv('NOTION_DATABASE_ID')
-        self.scheduled_posts = []
+        # Pending posts as a min-heap of (due, seq, post), where due is the
+        # scheduled time on the event loop's monotonic clock
+        self._heap: List[tuple] = []
+        self._seq = itertools.count()
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._send_tasks = set()
+        # Page ID -> loop time its status was written back (None while
+        # sending); a reload that queried earlier may still see it Pending
+        self._in_flight: Dict[str, Optional[float]] = {}
+        # Loop time the refresh whose results are in the heap started
+        self._loaded_at = 0.0
+        self._channel_cache: Dict[str, discord.TextChannel] = {}
+        # Notion property name -> property ID, fetched once per run
+        self._prop: Optional[Dict[str, str]] = None
         self.timezone = pytz.timezone('UTC')  # Change this to your timezone if needed
+        self.http_session: Optional[aiohttp.ClientSession] = None
+        # Recently downloaded media (only files small enough to stay in memory)
+        self._media_cache: TTLCache = TTLCache(maxsize=64, ttl=3600)
+        self._media_locks: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
+        # Each permit is held for at least a second, which caps both
+        # concurrent Notion writes and how many start per second
+        self._notion_limiter = asyncio.Semaphore(NOTION_WRITES_PER_SECOND)
+        
+    async def setup_hook(self):
+        """Create the shared HTTP session used for media downloads"""
+        # Pooled keep-alive connections so TLS handshakes and DNS lookups are reused
+        connector = aiohttp.TCPConnector(
+            limit=32,
+            limit_per_host=8,
+            ttl_dns_cache=300,
+            keepalive_timeout=60
+        )
+        self.http_session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=30)
+        )
+        
+    async def close(self):
+        """Close the HTTP clients before shutting down the bot"""
+        if self.http_session:
+            await self.http_session.close()
+        await self.notion.aclose()
+        await super().close()
         
     async def on_ready(self):
         logger.info(f'{self.user} has connected to Discord!')
         logger.info(f'Bot is in {len(self.guilds)} guild(s)')
         
-        # Start the scheduler
-        if not self.post_scheduler.is_running():
-            self.post_scheduler.start()
+        self.rebuild_channel_cache()
         
-        # Load initial posts
-        await self.load_scheduled_posts()
+        # Start the hourly refresh; its first run loads the initial posts
+        if not self.refresh_posts.is_running():
+            self.refresh_posts.start()
         
     async def load_scheduled_posts(self):
         """Load upcoming posts from Notion database"""
         try:
             # Get posts for next 48 hours that are still pending
             now = datetime.now(self.timezone)
+            loop_now = self.loop.time()
             future_time = now + timedelta(hours=48)
             
-            # Query Notion database
-            results = self.notion.databases.query(
+            # Refer to properties by ID and only fetch the ones we parse
+            prop = await self.get_property_map()
+            
+            # Query Notion database, following pagination cursors
+            query = dict(
                 database_id=self.database_id,
                 filter={
                     "and": [
                         {
-                            "property": "Status",
+                            "property": prop['Status'],
                             "select": {
                                 "equals": "Pending"
                             }
                         },
                         {
-                            "property": "Scheduled Time",
+                            "property": prop['Scheduled Time'],
                             "date": {
                                 "on_or_after": now.isoformat()
                             }
                         },
                         {
-                            "property": "Scheduled Time",
+                            "property": prop['Scheduled Time'],
                             "date": {
                                 "on_or_before": future_time.isoformat()
                             }
@@ -78,55 +186,91 @@ class DiscordSchedulerBot(commands.Bot):
                 },
                 sorts=[
                     {
-                        "property": "Scheduled Time",
+                        "property": prop['Scheduled Time'],
                         "direction": "ascending"
                     }
-                ]
+                ],
+                # IDs come back URL-encoded; the HTTP client encodes query params again
+                filter_properties=[unquote(prop[name]) for name in POST_PROPERTIES],
+                page_size=100
             )
             
-            self.scheduled_posts = []
-            for page in results['results']:
-                post_data = self.parse_notion_page(page)
-                if post_data:
-                    self.scheduled_posts.append(post_data)
+            heap = []
+            while True:
+                results = await self.notion.databases.query(**query)
+                for page in results['results']:
+                    post_data = self.parse_notion_page(page)
+                    if post_data:
+                        channel = self.find_channel_by_name(post_data.channel)
+                        post_data.channel_id = channel.id if channel else None
+                        due = loop_now + (post_data.scheduled_time - now).total_seconds()
+                        heap.append((due, next(self._seq), post_data))
+                
+                if not results['has_more']:
+                    break
+                query['start_cursor'] = results['next_cursor']
             
-            logger.info(f"Loaded {len(self.scheduled_posts)} scheduled posts")
+            # A refresh that started later has already swapped in newer results
+            if loop_now < self._loaded_at:
+                return
+            self._loaded_at = loop_now
+            
+            # Drop posts already handed to a send task (or sent since this
+            # query began), including any dispatched while later pages loaded
+            heap = [entry for entry in heap if entry[2].page_id not in self._in_flight]
+            heapq.heapify(heap)
+            self._heap = heap
+            # Statuses written before this query started are reflected in it
+            self._in_flight = {
+                page_id: written for page_id, written in self._in_flight.items()
+                if written is None or written >= loop_now
+            }
+            logger.info(f"Loaded {len(self._heap)} scheduled posts")
+            self.schedule_next_post()
             
         except Exception as e:
             logger.error(f"Error loading scheduled posts: {e}")
     
-    def parse_notion_page(self, page) -> Optional[Dict]:
+    async def get_property_map(self) -> Dict[str, str]:
+        """Look up the database's property IDs by name (once)"""
+        if self._prop is None:
+            database = await self.notion.databases.retrieve(database_id=self.database_id)
+            self._prop = {name: prop['id'] for name, prop in database['properties'].items()}
+        return self._prop
+    
+    def parse_notion_page(self, page) -> Optional[ScheduledPost]:
         """Parse a Notion page into post data"""
         try:
             properties = page['properties']
             
             # Extract data from Notion page
-            post_id = properties['Post ID']['title'][0]['text']['content'] if properties['Post ID']['title'] else None
-            channel_name = properties['Channel']['rich_text'][0]['text']['content'] if properties['Channel']['rich_text'] else None
-            scheduled_time_str = properties['Scheduled Time']['date']['start'] if properties['Scheduled Time']['date'] else None
-            content = properties['Content']['rich_text'][0]['text']['content'] if properties['Content']['rich_text'] else ""
-            media_urls = properties['Media URLs']['rich_text'][0]['text']['content'] if properties['Media URLs']['rich_text'] else ""
-            post_type = properties['Post Type']['select']['name'] if properties['Post Type']['select'] else "Normal"
+            post_id = first_text(properties['Post ID'], 'title')
+            channel_name = first_text(properties['Channel'])
+            scheduled_date = properties['Scheduled Time']['date']
+            scheduled_time_str = scheduled_date['start'] if scheduled_date else None
+            content = first_text(properties['Content']) or ""
+            media_urls = first_text(properties['Media URLs']) or ""
+            post_type_select = properties['Post Type']['select']
+            post_type = post_type_select['name'] if post_type_select else "Normal"
             
             if not all([post_id, channel_name, scheduled_time_str]):
                 logger.warning(f"Missing required fields in post: {post_id}")
                 return None
             
             # Parse scheduled time
-            scheduled_time = datetime.fromisoformat(scheduled_time_str.replace('Z', '+00:00'))
+            scheduled_time = ciso8601.parse_datetime(scheduled_time_str)
             if scheduled_time.tzinfo is None:
                 scheduled_time = self.timezone.localize(scheduled_time)
             
-            return {
-                'id': post_id,
-                'page_id': page['id'],
-                'channel': channel_name,
-                'scheduled_time': scheduled_time,
-                'content': content,
-                'media_urls': media_urls.split('\n') if media_urls else [],
-                'post_type': post_type,
-                'posted': False
-            }
+            return ScheduledPost(
+                id=post_id,
+                page_id=page['id'],
+                channel=channel_name,
+                scheduled_time=scheduled_time,
+                content=content,
+                media_urls=[url for line in media_urls.splitlines() if (url := line.strip())],
+                post_type=post_type
+            )
             
         except Exception as e:
             logger.error(f"Error parsing Notion page: {e}")
@@ -155,101 +299,250 @@ class DiscordSchedulerBot(commands.Bot):
                     ]
                 }
             
-            self.notion.pages.update(
-                page_id=page_id,
-                properties=update_data
-            )
+            for attempt in range(NOTION_RATE_LIMIT_RETRIES):
+                try:
+                    async with self._notion_limiter:
+                        started = self.loop.time()
+                        try:
+                            await self.notion.pages.update(
+                                page_id=page_id,
+                                properties=update_data
+                            )
+                        finally:
+                            await asyncio.sleep(max(0, 1 - (self.loop.time() - started)))
+                    break
+                except APIResponseError as e:
+                    if e.code != APIErrorCode.RateLimited or attempt == NOTION_RATE_LIMIT_RETRIES - 1:
+                        raise
+                    retry_after = float(e.headers.get('retry-after', 1))
+                    logger.warning(f"Notion rate limited status update for {page_id}, retrying in {retry_after}s")
+                    await asyncio.sleep(retry_after)
             
         except Exception as e:
             logger.error(f"Error updating post status: {e}")
     
+    @property
+    def pending_count(self) -> int:
+        """Number of posts still waiting to be sent"""
+        return len(self._heap)
+    
+    def upcoming_posts(self, count: int) -> List[ScheduledPost]:
+        """Return the next `count` pending posts in scheduled order"""
+        return [post for _, _, post in heapq.nsmallest(count, self._heap)]
+    
+    def rebuild_channel_cache(self):
+        """Index every text channel by lowercase name"""
+        cache = {}
+        for guild in self.guilds:
+            for channel in guild.text_channels:
+                # First match wins, as with the old linear search
+                cache.setdefault(channel.name.lower(), channel)
+        self._channel_cache = cache
+    
+    async def on_guild_channel_create(self, channel):
+        self.rebuild_channel_cache()
+    
+    async def on_guild_channel_update(self, before, after):
+        self.rebuild_channel_cache()
+    
+    async def on_guild_channel_delete(self, channel):
+        self.rebuild_channel_cache()
+    
+    async def on_guild_join(self, guild):
+        self.rebuild_channel_cache()
+    
+    async def on_guild_remove(self, guild):
+        self.rebuild_channel_cache()
+    
     def find_channel_by_name(self, channel_name: str):
         """Find Discord channel by name"""
-        for guild in self.guilds:
-            for channel in guild.channels:
-                if channel.name.lower() == channel_name.lower() and isinstance(channel, discord.TextChannel):
-                    return channel
-        return None
+        return self._channel_cache.get(channel_name.lower())
     
-    async def send_scheduled_post(self, post_data: Dict):
-        """Send a scheduled post to Discord"""
-        try:
-            # Find the channel
-            channel = self.find_channel_by_name(post_data['channel'])
-            if not channel:
-                error_msg = f"Channel '{post_data['channel']}' not found"
-                logger.error(error_msg)
-                await self.update_post_status(post_data['page_id'], "Failed", error_msg)
-                return
-            
-            # Prepare message content
-            content = post_data['content']
-            files = []
-            
-            # Handle media URLs
-            for url in post_data['media_urls']:
-                if url.strip():
-                    try:
-                        # Download and attach media
-                        response = requests.get(url.strip(), timeout=30)
-                        if response.status_code == 200:
-                            # Get filename from URL or create one
-                            filename = url.split('/')[-1]
-                            if '.' not in filename:
-                                filename += '.jpg'  # Default extension
-                            
-                            files.append(discord.File(
-                                fp=response.content,
-                                filename=filename
-                            ))
-                    except Exception as e:
-                        logger.warning(f"Failed to download media {url}: {e}")
-                        # Add URL to content if download fails
-                        content += f"\n{url}"
+    async def download_media(self, url: str) -> Optional[tempfile.SpooledTemporaryFile]:
+        """Stream a media URL into a buffer, rewound and ready to read"""
+        async with self.http_session.get(url) as response:
+            if response.status != 200:
+                return None
             
-            # Send message based on post type
-            if post_data['post_type'] == "Announcement":
-                # Send as announcement (ping @everyone)
-                await channel.send(f"@everyone\n\n{content}", files=files)
-            else:
+            # Stream into a buffer that spills to disk past MEDIA_SPOOL_SIZE
+            buffer = tempfile.SpooledTemporaryFile(max_size=MEDIA_SPOOL_SIZE)
+            try:
+                async for chunk in response.content.iter_chunked(MEDIA_CHUNK_SIZE):
+                    buffer.write(chunk)
+            except BaseException:
+                buffer.close()
+                raise
+            buffer.seek(0)
+            return buffer
+    
+    async def fetch_media(self, url: str) -> Optional[discord.File]:
+        """Download a media URL as a Discord attachment, reusing recent downloads"""
+        # Get filename from URL or create one
+        filename = url.split('/')[-1]
+        if '.' not in filename:
+            filename += '.jpg'  # Default extension
+        
+        data = self._media_cache.get(url)
+        if data is None:
+            # Posts sent concurrently share a single download per URL
+            lock = self._media_locks.get(url)
+            if lock is None:
+                lock = self._media_locks[url] = asyncio.Lock()
+            async with lock:
+                data = self._media_cache.get(url)
+                if data is None:
+                    buffer = await self.download_media(url)
+                    if buffer is None:
+                        return None
+                    
+                    # Too big to keep in memory: send it straight from the spool
+                    buffer.seek(0, io.SEEK_END)
+                    if buffer.tell() > MEDIA_SPOOL_SIZE:
+                        buffer.seek(0)
+                        return discord.File(fp=buffer, filename=filename)
+                    
+                    buffer.seek(0)
+                    data = buffer.read()
+                    buffer.close()
+                    self._media_cache[url] = data
+        
+        return discord.File(fp=io.BytesIO(data), filename=filename)
+    
+    def resolve_channel(self, post: ScheduledPost):
+        """Find a post's channel by the ID resolved at load time, falling back
+        to the name for channels created since then"""
+        channel = self.get_channel(post.channel_id) if post.channel_id else None
+        return channel or self.find_channel_by_name(post.channel)
+    
+    async def build_message(self, post: ScheduledPost) -> Tuple[str, List[discord.File]]:
+        """Prepare a post's message content and download its media"""
+        content = post.content
+        files = []
+        
+        # Download all media URLs concurrently
+        results = await asyncio.gather(
+            *(self.fetch_media(url) for url in post.media_urls),
+            return_exceptions=True
+        )
+        for url, result in zip(post.media_urls, results):
+            if isinstance(result, Exception):
+                logger.warning(f"Failed to download media {url}: {result}")
+                # Add URL to content if download fails
+                content += f"\n{url}"
+            elif result:
+                files.append(result)
+        
+        if post.post_type == "Announcement":
+            # Send as announcement (ping @everyone)
+            content = f"@everyone\n\n{content}"
+        
+        return content, files
+    
+    async def send_channel_posts(self, channel, messages: List[tuple]) -> List[tuple]:
+        """Send prepared posts to one channel in order, returning (post, status, error) for each"""
+        outcomes = []
+        for post, (content, files) in messages:
+            try:
                 await channel.send(content, files=files)
-            
-            # Update status to Posted
-            await self.update_post_status(post_data['page_id'], "Posted")
-            logger.info(f"Successfully posted: {post_data['id']}")
-            
-        except Exception as e:
-            error_msg = f"Error sending post: {e}"
-            logger.error(error_msg)
-            await self.update_post_status(post_data['page_id'], "Failed", str(e))
+                logger.info(f"Successfully posted: {post.id}")
+                outcomes.append((post, "Posted", ""))
+            except Exception as e:
+                logger.error(f"Error sending post: {e}")
+                outcomes.append((post, "Failed", str(e)))
+            finally:
+                # discord.File leaves buffers we passed in open
+                for file in files:
+                    file.close()
+                    file.fp.close()
+        return outcomes
+    
+    def schedule_next_post(self):
+        """Arm a timer that fires when the earliest pending post is due"""
+        if self._timer:
+            self._timer.cancel()
+            self._timer = None
+        
+        if self._heap:
+            self._timer = self.loop.call_at(self._heap[0][0], self.dispatch_due_posts)
     
-    @tasks.loop(minutes=1)
-    async def post_scheduler(self):
-        """Check for posts that need to be sent"""
+    def dispatch_due_posts(self):
+        """Timer callback: hand every due post to a send task"""
+        self._timer = None
+        now = self.loop.time()
+        posts_to_send = []
+        
+        # Pop every post that should be sent now
+        while self._heap and self._heap[0][0] <= now:
+            _, _, post = heapq.heappop(self._heap)
+            posts_to_send.append(post)
+            self._in_flight[post.page_id] = None
+        
+        self.schedule_next_post()
+        
+        if posts_to_send:
+            task = asyncio.create_task(self.send_due_posts(posts_to_send))
+            # Hold a reference so the task isn't garbage collected mid-send
+            self._send_tasks.add(task)
+            task.add_done_callback(self._send_tasks.discard)
+    
+    async def send_due_posts(self, posts_to_send: List[ScheduledPost]):
+        """Send due posts in batched phases so one slow post can't hold up the rest"""
         try:
-            now = datetime.now(self.timezone)
-            posts_to_send = []
+            outcomes = []
             
-            # Find posts that should be sent now
-            for post in self.scheduled_posts[:]:  # Copy list to iterate safely
-                if not post['posted'] and post['scheduled_time'] <= now:
-                    posts_to_send.append(post)
-                    post['posted'] = True  # Mark as processed
-            
-            # Send the posts
+            # Phase 1: resolve every post's channel
+            ready = []
             for post in posts_to_send:
-                await self.send_scheduled_post(post)
+                channel = self.resolve_channel(post)
+                if channel:
+                    ready.append((post, channel))
+                else:
+                    error_msg = f"Channel '{post.channel}' not found"
+                    logger.error(error_msg)
+                    outcomes.append((post, "Failed", error_msg))
+            
+            # Phase 2: download media for all posts at once
+            messages = await asyncio.gather(
+                *(self.build_message(post) for post, _ in ready),
+                return_exceptions=True
+            )
+            
+            # Phase 3: send - channels in parallel, in order within each channel
+            messages_by_channel = defaultdict(list)
+            for (post, channel), message in zip(ready, messages):
+                if isinstance(message, Exception):
+                    logger.error(f"Error preparing post {post.id}: {message}")
+                    outcomes.append((post, "Failed", str(message)))
+                else:
+                    messages_by_channel[channel].append((post, message))
+            channel_outcomes = await asyncio.gather(
+                *(self.send_channel_posts(channel, channel_messages)
+                  for channel, channel_messages in messages_by_channel.items())
+            )
+            for results in channel_outcomes:
+                outcomes.extend(results)
+            
+            # Phase 4: record every result in Notion
+            await asyncio.gather(
+                *(self.update_post_status(post.page_id, status, error_msg)
+                  for post, status, error_msg in outcomes)
+            )
             
-            # Refresh scheduled posts every hour
-            if now.minute == 0:
-                await self.load_scheduled_posts()
-                
         except Exception as e:
-            logger.error(f"Error in post scheduler: {e}")
+            logger.error(f"Error sending due posts: {e}")
+        finally:
+            written = self.loop.time()
+            for post in posts_to_send:
+                self._in_flight[post.page_id] = written
+    
+    @tasks.loop(hours=1)
+    async def refresh_posts(self):
+        """Refresh the queue from Notion every hour"""
+        await self.load_scheduled_posts()
     
-    @post_scheduler.before_loop
-    async def before_scheduler(self):
-        """Wait for bot to be ready before starting scheduler"""
+    @refresh_posts.before_loop
+    async def before_refresh(self):
+        """Wait for bot to be ready before the first refresh"""
         await self.wait_until_ready()
 
 # Bot commands
@@ -259,7 +552,7 @@ bot = DiscordSchedulerBot()
 async def status(ctx):
     """Check bot status and upcoming posts"""
     try:
-        upcoming_count = len([p for p in bot.scheduled_posts if not p['posted']])
+        upcoming_count = bot.pending_count
         embed = discord.Embed(
             title="📅 Scheduler Status",
             color=0x00ff00,
@@ -285,7 +578,7 @@ async def reload_posts(ctx):
     """Manually reload posts from Notion"""
     try:
         await bot.load_scheduled_posts()
-        upcoming_count = len([p for p in bot.scheduled_posts if not p['posted']])
+        upcoming_count = bot.pending_count
         await ctx.send(f"✅ Reloaded! Found {upcoming_count} upcoming posts.")
         
     except Exception as e:
@@ -295,7 +588,7 @@ async def reload_posts(ctx):
 async def next_posts(ctx, count: int = 5):
     """Show next few scheduled posts"""
     try:
-        upcoming_posts = [p for p in bot.scheduled_posts if not p['posted']][:count]
+        upcoming_posts = bot.upcoming_posts(count)
         
         if not upcoming_posts:
             await ctx.send("No upcoming posts found.")
@@ -307,11 +600,11 @@ async def next_posts(ctx, count: int = 5):
         )
         
         for post in upcoming_posts:
-            time_str = post['scheduled_time'].strftime('%Y-%m-%d %H:%M %Z')
-            content_preview = post['content'][:50] + "..." if len(post['content']) > 50 else post['content']
+            time_str = post.scheduled_time.strftime('%Y-%m-%d %H:%M %Z')
+            content_preview = post.content[:50] + "..." if len(post.content) > 50 else post.content
             
             embed.add_field(
-                name=f"#{post['channel']} - {time_str}",
+                name=f"#{post.channel} - {time_str}",
                 value=f"{content_preview}",
                 inline=False
             )
@@ -330,6 +623,10 @@ if __name__ == "__main__":
         logger.error(f"Missing required environment variables: {missing_vars}")
         exit(1)
     
+    # Use the libuv-based event loop when available
+    if uvloop:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    
     # Run the bot
     try:
         bot.run(os.getenv('DISCORD_TOKEN'))
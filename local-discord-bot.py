@@ -18,18 +18,28 @@ print(f"  Database ID: {NOTION_DATABASE_ID}")
 import discord
 from discord.ext import commands, tasks
 import asyncio
+import io
 from datetime import datetime, timedelta, timezone
-import pytz
+from zoneinfo import ZoneInfo
+import time
 import logging
-from notion_client import Client
-import requests
-from typing import List, Dict, Optional
+from notion_client import AsyncClient, APIErrorCode, APIResponseError
+import httpx
+from typing import AsyncIterator, List, Dict, Optional, Tuple
 import json
-import pickle
+import heapq
+import itertools
+from collections import defaultdict
+from dataclasses import dataclass
 from pathlib import Path
 import ssl
 import certifi
 
+try:
+    import uvloop
+except ImportError:  # uvloop is not available on Windows
+    uvloop = None
+
 # Set up logging
 logging.basicConfig(
     level=logging.INFO,
@@ -49,6 +59,67 @@ try:
 except Exception as e:
     logger.warning(f"SSL fix failed: {e}")
 
+@dataclass(slots=True)
+class ScheduledPost:
+    """A pending post parsed from the Notion database"""
+    id: str
+    page_id: str
+    channel: str
+    channel_key: str  # lowercased channel name, matches _channel_by_name keys
+    scheduled_time: datetime
+    scheduled_ts: float
+    content: str
+    media_urls: List[str]
+    post_type: str
+
+# Discord's upload limit for servers without boosts
+MAX_MEDIA_BYTES = 25 * 1024 * 1024
+MEDIA_CHUNK_SIZE = 64 * 1024
+
+# Connection pool shared by requests to the same host
+HTTP_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=50)
+
+# Notion allows an average of ~3 requests per second per integration
+NOTION_WRITES_PER_SECOND = 3
+NOTION_RATE_LIMIT_RETRIES = 3
+
+# Timers run on the monotonic clock, which stops while the laptop sleeps,
+# so re-check the wall clock at least this often (seconds)
+MAX_TIMER_DELAY = 60
+
+# Notion query pieces shared by the catch-up and upcoming-posts queries
+SCHEDULED_TIME_SORTS = [
+    {
+        "property": "Scheduled Time",
+        "direction": "ascending"
+    }
+]
+
+def pending_posts_filter(start: datetime, end: datetime) -> Dict:
+    """Notion filter for Pending posts scheduled between start and end (inclusive)"""
+    return {
+        "and": [
+            {
+                "property": "Status",
+                "select": {
+                    "equals": "Pending"
+                }
+            },
+            {
+                "property": "Scheduled Time",
+                "date": {
+                    "on_or_after": start.isoformat()
+                }
+            },
+            {
+                "property": "Scheduled Time",
+                "date": {
+                    "on_or_before": end.isoformat()
+                }
+            }
+        ]
+    }
+
 class LocalDiscordBot(commands.Bot):
     def __init__(self):
         intents = discord.Intents.default()
@@ -56,28 +127,63 @@ class LocalDiscordBot(commands.Bot):
         super().__init__(command_prefix='!', intents=intents)
         
         # Use the pre-loaded environment variables
-        self.notion = Client(auth=NOTION_TOKEN)
+        # Keep-alive HTTP/2 connection pools. Notion gets its own client:
+        # notion-client sets its auth header on whichever client it is given,
+        # and that token must not be sent to media hosts.
+        self.notion = AsyncClient(
+            auth=NOTION_TOKEN,
+            client=httpx.AsyncClient(http2=True, limits=HTTP_LIMITS)
+        )
+        # Media hosts and CDNs often redirect; httpx doesn't follow by default
+        self.http_client = httpx.AsyncClient(
+            http2=True, timeout=30, limits=HTTP_LIMITS, follow_redirects=True
+        )
         self.database_id = NOTION_DATABASE_ID
-        self.scheduled_posts = []
-        self.timezone = pytz.timezone(TIMEZONE)
-        self.cache_file = Path('scheduled_posts_cache.pkl')
+        # Pending posts as a min-heap of (scheduled_ts, seq, post), keyed on
+        # the POSIX timestamp so comparisons are plain float compares
+        self.scheduled_heap: List[tuple] = []
+        self._seq = itertools.count()
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._send_tasks = set()
+        # Page ID -> monotonic time its status was written back (None while
+        # sending); a refresh that queried earlier may still see it Pending
+        self._in_flight: Dict[str, Optional[float]] = {}
+        # Start time of the refresh whose results are in the heap
+        self._loaded_at = 0.0
+        self.timezone = ZoneInfo(TIMEZONE)
+        self.cache_file = Path('last_run.json')
         self.startup_time = None
+        # Each permit is held for at least a second, which caps both
+        # concurrent Notion writes and how many start per second
+        self._notion_limiter = asyncio.Semaphore(NOTION_WRITES_PER_SECOND)
+        self._channel_by_name: Dict[str, discord.TextChannel] = {}
+        
+    async def setup_hook(self):
+        """Configure the event loop before connecting to Discord"""
+        # Python 3.12+: run new tasks inline until they first suspend
+        if hasattr(asyncio, 'eager_task_factory'):
+            asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+        
+    async def close(self):
+        """Close the HTTP clients before shutting down the bot"""
+        await self.http_client.aclose()
+        await self.notion.aclose()
+        await super().close()
         
     async def on_ready(self):
         logger.info(f'{self.user} has connected to Discord!')
         logger.info(f'Bot is in {len(self.guilds)} guild(s)')
         
         self.startup_time = datetime.now(self.timezone)
+        self.rebuild_channel_cache()
         
         # Check for missed posts first
         await self.check_missed_posts()
         
-        # Load upcoming posts (7 days ahead for offline tolerance)
-        await self.load_scheduled_posts()
-        
-        # Start the scheduler
-        if not self.post_scheduler.is_running():
-            self.post_scheduler.start()
+        # Start the 2-hourly refresh; its first run loads upcoming posts
+        # (7 days ahead for offline tolerance) and arms the post timer
+        if not self.refresh_posts.is_running():
+            self.refresh_posts.start()
         
         # Save cache every hour
         if not self.cache_saver.is_running():
@@ -91,7 +197,7 @@ class LocalDiscordBot(commands.Bot):
             logger.info("🔍 Checking for missed posts...")
             
             # Get last shutdown time from cache
-            last_run_time = self.get_last_run_time()
+            last_run_time = await asyncio.to_thread(self.get_last_run_time)
             if not last_run_time:
                 logger.info("No previous run time found - fresh start")
                 return
@@ -100,49 +206,31 @@ class LocalDiscordBot(commands.Bot):
             logger.info(f"Current time: {self.startup_time}")
             
             # Query Notion for posts that should have been sent between last run and now
-            missed_results = self.notion.databases.query(
-                database_id=self.database_id,
-                filter={
-                    "and": [
-                        {
-                            "property": "Status",
-                            "select": {
-                                "equals": "Pending"
-                            }
-                        },
-                        {
-                            "property": "Scheduled Time",
-                            "date": {
-                                "on_or_after": last_run_time.isoformat()
-                            }
-                        },
-                        {
-                            "property": "Scheduled Time",
-                            "date": {
-                                "on_or_before": self.startup_time.isoformat()
-                            }
-                        }
-                    ]
-                },
-                sorts=[
-                    {
-                        "property": "Scheduled Time",
-                        "direction": "ascending"
-                    }
-                ]
-            )
-            
-            missed_posts = []
-            for page in missed_results['results']:
-                post_data = self.parse_notion_page(page)
-                if post_data:
-                    missed_posts.append(post_data)
+            # skipping any a timer batch or earlier catch-up is already sending
+            missed_posts = [
+                post_data async for post_data
+                in self.iter_pending_posts(last_run_time, self.startup_time)
+                if post_data.page_id not in self._in_flight
+            ]
             
             if missed_posts:
                 logger.info(f"📬 Found {len(missed_posts)} missed posts - sending now...")
+                
+                # Channels catch up in parallel; each channel keeps its order
+                posts_by_channel = defaultdict(list)
                 for post in missed_posts:
-                    await self.send_scheduled_post(post, is_catchup=True)
-                    await asyncio.sleep(2)  # Small delay between catch-up posts
+                    posts_by_channel[post.channel_key].append(post)
+                    self._in_flight[post.page_id] = None
+                try:
+                    channel_results = await asyncio.gather(
+                        *(self.send_catchup_posts(posts) for posts in posts_by_channel.values())
+                    )
+                    
+                    await self.update_post_statuses(
+                        [result for results in channel_results for result in results]
+                    )
+                finally:
+                    self.mark_written(missed_posts)
             else:
                 logger.info("✅ No missed posts found")
                 
@@ -153,9 +241,8 @@ class LocalDiscordBot(commands.Bot):
         """Get the last time the bot was running"""
         try:
             if self.cache_file.exists():
-                with open(self.cache_file, 'rb') as f:
-                    cache_data = pickle.load(f)
-                    return cache_data.get('last_run_time')
+                cache_data = json.loads(self.cache_file.read_text())
+                return datetime.fromisoformat(cache_data['last_run_time'])
         except Exception as e:
             logger.warning(f"Could not read cache: {e}")
         return None
@@ -163,17 +250,11 @@ class LocalDiscordBot(commands.Bot):
     def save_last_run_time(self):
         """Save current time as last run time"""
         try:
-            cache_data = {}
-            if self.cache_file.exists():
-                with open(self.cache_file, 'rb') as f:
-                    cache_data = pickle.load(f)
-            
-            cache_data['last_run_time'] = datetime.now(self.timezone)
-            cache_data['scheduled_posts'] = self.scheduled_posts
+            # Scheduled posts are reloaded from Notion on start, so only the
+            # timestamp needs to survive a restart
+            cache_data = {'last_run_time': datetime.now(self.timezone).isoformat()}
+            self.cache_file.write_text(json.dumps(cache_data))
             
-            with open(self.cache_file, 'wb') as f:
-                pickle.dump(cache_data, f)
-                
         except Exception as e:
             logger.error(f"Error saving cache: {e}")
         
@@ -185,91 +266,110 @@ class LocalDiscordBot(commands.Bot):
             # Get posts for next 7 days (offline tolerance)
             now = datetime.now(self.timezone)
             future_time = now + timedelta(days=7)
+            started = time.monotonic()
             
             # Query Notion database
-            results = self.notion.databases.query(
-                database_id=self.database_id,
-                filter={
-                    "and": [
-                        {
-                            "property": "Status",
-                            "select": {
-                                "equals": "Pending"
-                            }
-                        },
-                        {
-                            "property": "Scheduled Time",
-                            "date": {
-                                "on_or_after": now.isoformat()
-                            }
-                        },
-                        {
-                            "property": "Scheduled Time",
-                            "date": {
-                                "on_or_before": future_time.isoformat()
-                            }
-                        }
-                    ]
-                },
-                sorts=[
-                    {
-                        "property": "Scheduled Time",
-                        "direction": "ascending"
-                    }
-                ]
-            )
+            heap = []
+            async for post_data in self.iter_pending_posts(now, future_time):
+                heap.append((post_data.scheduled_ts, next(self._seq), post_data))
             
-            self.scheduled_posts = []
-            for page in results['results']:
-                post_data = self.parse_notion_page(page)
-                if post_data:
-                    self.scheduled_posts.append(post_data)
+            # A refresh that started later has already swapped in newer results
+            if started < self._loaded_at:
+                return
+            self._loaded_at = started
+            
+            # Drop posts still Pending in this snapshot but already handed to
+            # a send task, including any dispatched while later pages loaded
+            heap = [entry for entry in heap if entry[2].page_id not in self._in_flight]
+            heapq.heapify(heap)
+            self.scheduled_heap = heap
+            # Statuses written before this query started are reflected in it
+            self._in_flight = {
+                page_id: written for page_id, written in self._in_flight.items()
+                if written is None or written >= started
+            }
             
-            logger.info(f"✅ Loaded {len(self.scheduled_posts)} scheduled posts (next 7 days)")
+            logger.info(f"✅ Loaded {len(self.scheduled_heap)} scheduled posts (next 7 days)")
+            self.schedule_next_post()
             
             # Show next few posts
-            if self.scheduled_posts:
+            if self.scheduled_heap:
                 logger.info("📋 Next 3 posts:")
-                for i, post in enumerate(self.scheduled_posts[:3]):
-                    time_str = post['scheduled_time'].strftime('%Y-%m-%d %H:%M')
-                    content_preview = post['content'][:50] + "..." if len(post['content']) > 50 else post['content']
-                    logger.info(f"  {i+1}. [{time_str}] #{post['channel']}: {content_preview}")
+                for i, post in enumerate(self.upcoming_posts(3)):
+                    time_str = post.scheduled_time.strftime('%Y-%m-%d %H:%M')
+                    content_preview = post.content[:50] + "..." if len(post.content) > 50 else post.content
+                    logger.info(f"  {i+1}. [{time_str}] #{post.channel}: {content_preview}")
             
         except Exception as e:
             logger.error(f"Error loading scheduled posts: {e}")
     
-    def parse_notion_page(self, page) -> Optional[Dict]:
+    async def iter_pending_posts(self, start: datetime, end: datetime) -> AsyncIterator[ScheduledPost]:
+        """Yield parsed Pending posts scheduled between start and end, fetching
+        one page of Notion results at a time"""
+        cursor = None
+        while True:
+            results = await self.notion.databases.query(
+                database_id=self.database_id,
+                filter=pending_posts_filter(start, end),
+                sorts=SCHEDULED_TIME_SORTS,
+                start_cursor=cursor,
+                page_size=100
+            )
+            for page in results['results']:
+                post_data = self.parse_notion_page(page)
+                if post_data:
+                    yield post_data
+            
+            if not results['has_more']:
+                return
+            cursor = results['next_cursor']
+            # Drop the raw page before fetching the next, and let other
+            # tasks run between pages on large queues
+            del results
+            await asyncio.sleep(0)
+    
+    def parse_notion_page(self, page) -> Optional[ScheduledPost]:
         """Parse a Notion page into post data"""
         try:
             properties = page['properties']
             
-            # Extract data from Notion page
-            post_id = properties['Post ID']['title'][0]['text']['content'] if properties['Post ID']['title'] else None
-            channel_name = properties['Channel']['rich_text'][0]['text']['content'] if properties['Channel']['rich_text'] else None
-            scheduled_time_str = properties['Scheduled Time']['date']['start'] if properties['Scheduled Time']['date'] else None
-            content = properties['Content']['rich_text'][0]['text']['content'] if properties['Content']['rich_text'] else ""
-            media_urls = properties['Media URLs']['rich_text'][0]['text']['content'] if properties['Media URLs']['rich_text'] else ""
-            post_type = properties['Post Type']['select']['name'] if properties['Post Type']['select'] else "Normal"
+            # Extract data from Notion page - bind each property once
+            post_id_prop = properties['Post ID']['title']
+            channel_prop = properties['Channel']['rich_text']
+            scheduled_time_prop = properties['Scheduled Time']['date']
+            content_prop = properties['Content']['rich_text']
+            media_urls_prop = properties['Media URLs']['rich_text']
+            post_type_prop = properties['Post Type']['select']
+            
+            post_id = post_id_prop[0]['text']['content'] if post_id_prop else None
+            channel_name = channel_prop[0]['text']['content'] if channel_prop else None
+            scheduled_time_str = scheduled_time_prop['start'] if scheduled_time_prop else None
+            content = content_prop[0]['text']['content'] if content_prop else ""
+            media_urls = media_urls_prop[0]['text']['content'] if media_urls_prop else ""
+            post_type = post_type_prop['name'] if post_type_prop else "Normal"
             
             if not all([post_id, channel_name, scheduled_time_str]):
                 logger.warning(f"Missing required fields in post: {post_id}")
                 return None
             
             # Parse scheduled time
-            scheduled_time = datetime.fromisoformat(scheduled_time_str.replace('Z', '+00:00'))
+            if scheduled_time_str.endswith('Z'):
+                scheduled_time_str = scheduled_time_str[:-1] + '+00:00'
+            scheduled_time = datetime.fromisoformat(scheduled_time_str)
             if scheduled_time.tzinfo is None:
-                scheduled_time = self.timezone.localize(scheduled_time)
-            
-            return {
-                'id': post_id,
-                'page_id': page['id'],
-                'channel': channel_name,
-                'scheduled_time': scheduled_time,
-                'content': content,
-                'media_urls': media_urls.split('\n') if media_urls else [],
-                'post_type': post_type,
-                'posted': False
-            }
+                scheduled_time = scheduled_time.replace(tzinfo=self.timezone)
+            
+            return ScheduledPost(
+                id=post_id,
+                page_id=page['id'],
+                channel=channel_name,
+                channel_key=channel_name.lower(),
+                scheduled_time=scheduled_time,
+                scheduled_ts=scheduled_time.timestamp(),
+                content=content,
+                media_urls=media_urls.split('\n') if media_urls else [],
+                post_type=post_type
+            )
             
         except Exception as e:
             logger.error(f"Error parsing Notion page: {e}")
@@ -291,113 +391,215 @@ class LocalDiscordBot(commands.Bot):
                 # Don't overwrite content, just log the error
                 logger.error(f"Post failed: {error_message}")
             
-            self.notion.pages.update(
-                page_id=page_id,
-                properties=update_data
-            )
+            for attempt in range(NOTION_RATE_LIMIT_RETRIES):
+                try:
+                    async with self._notion_limiter:
+                        started = time.monotonic()
+                        try:
+                            await self.notion.pages.update(
+                                page_id=page_id,
+                                properties=update_data
+                            )
+                        finally:
+                            await asyncio.sleep(max(0, 1 - (time.monotonic() - started)))
+                    break
+                except APIResponseError as e:
+                    if e.code != APIErrorCode.RateLimited or attempt == NOTION_RATE_LIMIT_RETRIES - 1:
+                        raise
+                    retry_after = float(e.headers.get('retry-after', 1))
+                    logger.warning(f"Notion rate limited status update for {page_id}, retrying in {retry_after}s")
+                    await asyncio.sleep(retry_after)
             
         except Exception as e:
             logger.error(f"Error updating post status: {e}")
     
-    def find_channel_by_name(self, channel_name: str):
-        """Find Discord channel by name"""
+    @property
+    def pending_count(self) -> int:
+        """Number of posts still waiting to be sent"""
+        return len(self.scheduled_heap)
+    
+    def upcoming_posts(self, count: int) -> List[ScheduledPost]:
+        """Return the next `count` pending posts in scheduled order"""
+        return [post for _, _, post in heapq.nsmallest(count, self.scheduled_heap)]
+    
+    def rebuild_channel_cache(self):
+        """Index every text channel by lowercase name"""
+        cache = {}
         for guild in self.guilds:
-            for channel in guild.channels:
-                if channel.name.lower() == channel_name.lower() and isinstance(channel, discord.TextChannel):
-                    return channel
-        return None
+            for channel in guild.text_channels:
+                # First match wins, as with the old linear search
+                cache.setdefault(channel.name.lower(), channel)
+        self._channel_by_name = cache
+    
+    async def on_guild_channel_create(self, channel):
+        self.rebuild_channel_cache()
+    
+    async def on_guild_channel_update(self, before, after):
+        self.rebuild_channel_cache()
+    
+    async def on_guild_channel_delete(self, channel):
+        self.rebuild_channel_cache()
+    
+    async def on_guild_join(self, guild):
+        self.rebuild_channel_cache()
     
-    async def send_scheduled_post(self, post_data: Dict, is_catchup: bool = False):
-        """Send a scheduled post to Discord"""
+    async def on_guild_remove(self, guild):
+        self.rebuild_channel_cache()
+    
+    async def update_post_statuses(self, results: List[Tuple[str, str, str]]):
+        """Write a batch of (page_id, status, error_message) results to Notion concurrently"""
+        await asyncio.gather(
+            *(self.update_post_status(page_id, status, error_message)
+              for page_id, status, error_message in results)
+        )
+    
+    async def fetch_media(self, url: str) -> discord.File:
+        """Download a media URL as a Discord attachment"""
+        async with self.http_client.stream("GET", url) as response:
+            if response.status_code != 200:
+                raise ValueError(f"HTTP {response.status_code}")
+            
+            # Refuse files Discord won't accept, ideally before downloading them
+            too_big = ValueError(f"file is larger than {MAX_MEDIA_BYTES // (1024 * 1024)}MB")
+            if int(response.headers.get('content-length', 0)) > MAX_MEDIA_BYTES:
+                raise too_big
+            
+            buffer = io.BytesIO()
+            async for chunk in response.aiter_bytes(MEDIA_CHUNK_SIZE):
+                buffer.write(chunk)
+                if buffer.tell() > MAX_MEDIA_BYTES:
+                    raise too_big
+            buffer.seek(0)
+        
+        # Get filename from URL or create one
+        filename = url.split('/')[-1]
+        if '.' not in filename:
+            filename += '.jpg'  # Default extension
+        
+        return discord.File(fp=buffer, filename=filename)
+    
+    async def send_scheduled_post(self, post_data: ScheduledPost, is_catchup: bool = False) -> Tuple[str, str, str]:
+        """Send a scheduled post to Discord and return its (page_id, status, error_message)
+        for the caller to write back to Notion"""
         try:
             # Find the channel
-            channel = self.find_channel_by_name(post_data['channel'])
+            channel = self._channel_by_name.get(post_data.channel_key)
             if not channel:
-                error_msg = f"Channel '{post_data['channel']}' not found"
+                error_msg = f"Channel '{post_data.channel}' not found"
                 logger.error(error_msg)
-                await self.update_post_status(post_data['page_id'], "Failed", error_msg)
-                return
+                return post_data.page_id, "Failed", error_msg
             
             # Prepare message content
-            content = post_data['content']
+            content = post_data.content
             files = []
             
             # Add catch-up indicator if this is a missed post
             if is_catchup:
                 content = f"🔄 **[Catch-up Post]** {content}"
             
-            # Handle media URLs
-            for url in post_data['media_urls']:
-                if url.strip():
-                    try:
-                        # Download and attach media
-                        response = requests.get(url.strip(), timeout=30)
-                        if response.status_code == 200:
-                            # Get filename from URL or create one
-                            filename = url.split('/')[-1]
-                            if '.' not in filename:
-                                filename += '.jpg'  # Default extension
-                            
-                            files.append(discord.File(
-                                fp=response.content,
-                                filename=filename
-                            ))
-                    except Exception as e:
-                        logger.warning(f"Failed to download media {url}: {e}")
-                        # Add URL to content if download fails
-                        content += f"\n{url}"
+            # Download all media URLs concurrently
+            urls = [url.strip() for url in post_data.media_urls if url.strip()]
+            results = await asyncio.gather(
+                *(self.fetch_media(url) for url in urls),
+                return_exceptions=True
+            )
+            for url, result in zip(urls, results):
+                if isinstance(result, Exception):
+                    logger.warning(f"Failed to download media {url}: {result}")
+                    # Add URL to content if download fails
+                    content += f"\n{url}"
+                else:
+                    files.append(result)
             
             # Send message based on post type
-            if post_data['post_type'] == "Announcement":
+            if post_data.post_type == "Announcement":
                 # Send as announcement (ping @everyone)
                 await channel.send(f"@everyone\n\n{content}", files=files)
             else:
                 await channel.send(content, files=files)
             
-            # Update status to Posted
-            await self.update_post_status(post_data['page_id'], "Posted")
-            
             status_prefix = "🔄 Caught up:" if is_catchup else "✅ Posted:"
-            logger.info(f"{status_prefix} {post_data['id']}")
+            logger.info(f"{status_prefix} {post_data.id}")
+            return post_data.page_id, "Posted", ""
             
         except Exception as e:
             error_msg = f"Error sending post: {e}"
             logger.error(error_msg)
-            await self.update_post_status(post_data['page_id'], "Failed", str(e))
+            return post_data.page_id, "Failed", str(e)
+    
+    async def send_catchup_posts(self, posts: List[ScheduledPost]) -> List[Tuple[str, str, str]]:
+        """Send missed posts for one channel in order, spaced out"""
+        results = []
+        for i, post in enumerate(posts):
+            if i:
+                await asyncio.sleep(2)  # Small delay between catch-up posts
+            results.append(await self.send_scheduled_post(post, is_catchup=True))
+        return results
     
-    @tasks.loop(minutes=1)
-    async def post_scheduler(self):
-        """Check for posts that need to be sent"""
+    def schedule_next_post(self):
+        """Arm a timer that fires when the earliest pending post is due"""
+        if self._timer:
+            self._timer.cancel()
+            self._timer = None
+        
+        if self.scheduled_heap:
+            delay = min(max(0, self.scheduled_heap[0][0] - time.time()), MAX_TIMER_DELAY)
+            self._timer = self.loop.call_later(delay, self.dispatch_due_posts)
+    
+    def dispatch_due_posts(self):
+        """Timer callback: hand every due post to a send task"""
+        self._timer = None
+        now = time.time()
+        posts_to_send = []
+        
+        # Pop every post that should be sent now
+        while self.scheduled_heap and self.scheduled_heap[0][0] <= now:
+            _, _, post = heapq.heappop(self.scheduled_heap)
+            posts_to_send.append(post)
+            self._in_flight[post.page_id] = None
+        
+        self.schedule_next_post()
+        
+        if posts_to_send:
+            task = asyncio.create_task(self.send_due_posts(posts_to_send))
+            # Hold a reference so the task isn't garbage collected mid-send
+            self._send_tasks.add(task)
+            task.add_done_callback(self._send_tasks.discard)
+    
+    async def send_due_posts(self, posts_to_send: List[ScheduledPost]):
+        """Send due posts, then record the results in one batch"""
         try:
-            now = datetime.now(self.timezone)
-            posts_to_send = []
-            
-            # Find posts that should be sent now
-            for post in self.scheduled_posts[:]:  # Copy list to iterate safely
-                if not post['posted'] and post['scheduled_time'] <= now:
-                    posts_to_send.append(post)
-                    post['posted'] = True  # Mark as processed
-            
-            # Send the posts
+            results = []
             for post in posts_to_send:
-                await self.send_scheduled_post(post)
+                results.append(await self.send_scheduled_post(post))
+            await self.update_post_statuses(results)
             
-            # Refresh scheduled posts every 2 hours (instead of every hour)
-            if now.minute == 0 and now.hour % 2 == 0:
-                logger.info("🔄 Refreshing scheduled posts...")
-                await self.load_scheduled_posts()
-                
         except Exception as e:
-            logger.error(f"Error in post scheduler: {e}")
+            logger.error(f"Error sending due posts: {e}")
+        finally:
+            self.mark_written(posts_to_send)
+    
+    def mark_written(self, posts: List[ScheduledPost]):
+        """Record that these posts' statuses have been written back to Notion"""
+        written = time.monotonic()
+        for post in posts:
+            self._in_flight[post.page_id] = written
+    
+    @tasks.loop(hours=2)
+    async def refresh_posts(self):
+        """Refresh the 7-day queue from Notion every 2 hours"""
+        logger.info("🔄 Refreshing scheduled posts...")
+        await self.load_scheduled_posts()
     
     @tasks.loop(hours=1)
     async def cache_saver(self):
         """Save cache every hour for offline recovery"""
-        self.save_last_run_time()
+        # Disk writes run in a thread so a slow disk can't stall heartbeats
+        await asyncio.to_thread(self.save_last_run_time)
     
-    @post_scheduler.before_loop
-    async def before_scheduler(self):
-        """Wait for bot to be ready before starting scheduler"""
+    @refresh_posts.before_loop
+    async def before_refresh(self):
+        """Wait for bot to be ready before the first refresh"""
         await self.wait_until_ready()
     
     @cache_saver.before_loop
@@ -412,7 +614,7 @@ bot = LocalDiscordBot()
 async def status(ctx):
     """Check bot status and upcoming posts"""
     try:
-        upcoming_count = len([p for p in bot.scheduled_posts if not p['posted']])
+        upcoming_count = bot.pending_count
         uptime = datetime.now(bot.timezone) - bot.startup_time if bot.startup_time else timedelta(0)
         
         embed = discord.Embed(
@@ -450,7 +652,7 @@ async def reload_posts(ctx):
     """Manually reload posts from Notion"""
     try:
         await bot.load_scheduled_posts()
-        upcoming_count = len([p for p in bot.scheduled_posts if not p['posted']])
+        upcoming_count = bot.pending_count
         await ctx.send(f"🔄 Reloaded! Found {upcoming_count} upcoming posts (next 7 days).")
         
     except Exception as e:
@@ -471,7 +673,7 @@ async def manual_catchup(ctx):
 async def next_posts(ctx, count: int = 5):
     """Show next few scheduled posts"""
     try:
-        upcoming_posts = [p for p in bot.scheduled_posts if not p['posted']][:count]
+        upcoming_posts = bot.upcoming_posts(count)
         
         if not upcoming_posts:
             await ctx.send("📭 No upcoming posts found in the next 7 days.")
@@ -483,11 +685,11 @@ async def next_posts(ctx, count: int = 5):
         )
         
         for post in upcoming_posts:
-            time_str = post['scheduled_time'].strftime('%Y-%m-%d %H:%M %Z')
-            content_preview = post['content'][:50] + "..." if len(post['content']) > 50 else post['content']
+            time_str = post.scheduled_time.strftime('%Y-%m-%d %H:%M %Z')
+            content_preview = post.content[:50] + "..." if len(post.content) > 50 else post.content
             
             embed.add_field(
-                name=f"#{post['channel']} - {time_str}",
+                name=f"#{post.channel} - {time_str}",
                 value=f"{content_preview}",
                 inline=False
             )
@@ -501,7 +703,7 @@ async def next_posts(ctx, count: int = 5):
 async def on_disconnect():
     """Save state when disconnecting"""
     logger.info("💾 Bot disconnecting - saving state...")
-    bot.save_last_run_time()
+    await asyncio.to_thread(bot.save_last_run_time)
 
 if __name__ == "__main__":
     # Check for required environment variables
@@ -525,6 +727,11 @@ if __name__ == "__main__":
     logger.info(f"Timezone: {TIMEZONE}")
     logger.info("Features: 7-day queue, catch-up posts, offline tolerance")
     
+    # Use the libuv-based event loop when available
+    if uvloop:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        logger.info("Event loop: uvloop")
+    
     # Run the bot
     try:
         bot.run(DISCORD_TOKEN)